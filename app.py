@@ -53,3 +53,29 @@ st.dataframe(predictions, use_container_width=True)
 st.caption(
     "Predictions come from a quick regression/classification pipeline built on the sample data set, so treat them as illustrative only."
 )
+
+st.subheader("Hypothetical matchup")
+teams = list(analytics.team_list())
+matchup_cols = st.columns(3)
+matchup_team = matchup_cols[0].selectbox("Team", options=teams, index=teams.index(team))
+matchup_opponent = matchup_cols[1].selectbox(
+    "Opponent", options=[t for t in teams if t != matchup_team]
+)
+matchup_home = matchup_cols[2].radio("Venue", options=["Home", "Away"], horizontal=True) == "Home"
+matchup = analytics.project_matchup(matchup_team, matchup_opponent, matchup_home)
+for col, (metric, value) in zip(st.columns(len(matchup)), matchup.items()):
+    col.metric(metric, value)
+st.write(f"**{matchup_team} strength of schedule:** {analytics.strength_of_schedule(matchup_team)}")
+
+st.subheader(f"What if {team} sits players?")
+roster = analytics.team_roster(team)
+sidelined = st.multiselect("Sit players", options=list(roster.index))
+adjusted_minutes = {}
+for player in st.multiselect("Adjust minutes", options=[p for p in roster.index if p not in sidelined]):
+    adjusted_minutes[player] = st.slider(f"{player} minutes per game", 0.0, 48.0, float(roster[player]), 0.5)
+if sidelined or adjusted_minutes:
+    scenario = analytics.what_if(team, removed=sidelined, minutes=adjusted_minutes)
+    scenario_cols = st.columns(len(scenario.summary))
+    for col, (metric, value) in zip(scenario_cols, scenario.summary.items()):
+        col.metric(metric, value, delta=round(value - team_summary[metric], 2))
+    st.dataframe(scenario.projections, use_container_width=True)
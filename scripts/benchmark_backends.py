@@ -0,0 +1,140 @@
+"""Compare the CSV/pandas and SQLite backends on a many-season synthetic data set.
+
+Example:
+    python scripts/benchmark_backends.py --seasons 60
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+POSITIONS = ["PG", "SG", "SF", "PF", "C"]
+PLAYERS_PER_TEAM = 15
+GAMES_PER_TEAM = 82
+
+
+def synthetic_tables(n_seasons: int, seed: int = 0):
+    """Return (players, team_games) frames covering ``n_seasons`` seasons."""
+    rng = np.random.default_rng(seed)
+    teams = pd.read_csv(ROOT / "data" / "upcoming_games.csv")["team"].unique()
+    seasons = np.arange(2025 - n_seasons + 1, 2026)
+
+    n_players = len(teams) * PLAYERS_PER_TEAM * len(seasons)
+    players = pd.DataFrame(
+        {
+            "player": [f"Player {idx % (len(teams) * PLAYERS_PER_TEAM):04d}" for idx in range(n_players)],
+            "team": np.tile(np.repeat(teams, PLAYERS_PER_TEAM), len(seasons)),
+            "position": rng.choice(POSITIONS, n_players),
+            "season": np.repeat(seasons, len(teams) * PLAYERS_PER_TEAM),
+            "games_played": rng.integers(40, 83, n_players),
+            "minutes": rng.uniform(10, 38, n_players).round(1),
+            "points": rng.uniform(3, 32, n_players).round(1),
+            "rebounds": rng.uniform(1, 13, n_players).round(1),
+            "assists": rng.uniform(0.5, 11, n_players).round(1),
+            "steals": rng.uniform(0.1, 2, n_players).round(1),
+            "blocks": rng.uniform(0, 3, n_players).round(1),
+            "fg_pct": rng.uniform(0.38, 0.62, n_players).round(3),
+            "three_pct": rng.uniform(0.28, 0.45, n_players).round(3),
+            "ft_pct": rng.uniform(0.65, 0.93, n_players).round(3),
+            "usage_rate": rng.uniform(14, 35, n_players).round(1),
+            "win_shares": rng.uniform(0, 14, n_players).round(1),
+        }
+    )
+
+    n_games = len(teams) * GAMES_PER_TEAM * len(seasons)
+    game_day = np.tile(np.arange(GAMES_PER_TEAM) * 2, len(teams) * len(seasons))
+    season_col = np.repeat(seasons, len(teams) * GAMES_PER_TEAM)
+    team_col = np.tile(np.repeat(teams, GAMES_PER_TEAM), len(seasons))
+    team_points = rng.integers(90, 135, n_games)
+    games = pd.DataFrame(
+        {
+            "date": (
+                pd.to_datetime({"year": season_col, "month": 10, "day": 20}) + pd.to_timedelta(game_day, unit="D")
+            ).dt.strftime("%Y-%m-%d"),
+            "season": season_col,
+            "team": team_col,
+            "opponent": rng.choice(teams, n_games),
+            "home": rng.integers(0, 2, n_games),
+            "team_points": team_points,
+            "opponent_points": team_points + rng.integers(-20, 21, n_games),
+            "pace": rng.uniform(94, 104, n_games).round(1),
+            "offensive_rating": rng.uniform(105, 125, n_games).round(1),
+            "defensive_rating": rng.uniform(105, 125, n_games).round(1),
+            "rebound_pct": rng.uniform(46, 55, n_games).round(1),
+            "assist_ratio": rng.uniform(18, 24, n_games).round(1),
+        }
+    )
+    return players, games
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def run_backend(analytics, backend: str, team: str, player: str):
+    os.environ["ANALYTICS_BACKEND"] = backend
+    calls = {
+        # Elo ratings replay the whole game log; time them on their own line.
+        "load_team_ratings": (lambda _: analytics.load_team_ratings(), None),
+        "compute_team_summary": (analytics.compute_team_summary, team),
+        "search_players": (analytics.search_players, player[-3:]),
+        "team_trend": (analytics.team_trend, team),
+        "player_projection": (analytics.player_projection, player),
+    }
+    results, timings = {}, {}
+    for name, (func, arg) in calls.items():
+        # Cold timings start from empty caches so no call benefits from an earlier one.
+        analytics.clear_caches()
+        results[name], cold = _timed(func, arg)
+        _, warm = _timed(func, arg)
+        timings[name] = (cold, warm)
+    return results, timings
+
+
+def main(n_seasons: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        # Must be set before ``src`` is imported so every module reads the temp folder.
+        os.environ["ANALYTICS_DATA_DIR"] = tmp
+        from src import analytics, database, storage
+
+        players, games = synthetic_tables(n_seasons)
+        storage.write_partitions(players, "players")
+        storage.write_partitions(games, "team_games")
+        database.build_database()
+        (Path(tmp) / "upcoming_games.csv").write_text((ROOT / "data" / "upcoming_games.csv").read_text())
+        print(f"{n_seasons} seasons: {len(players):,} player rows, {len(games):,} game rows")
+
+        team, player = games["team"].iloc[0], players["player"].iloc[0]
+        csv_results, csv_timings = run_backend(analytics, "csv", team, player)
+        sql_results, sql_timings = run_backend(analytics, "sqlite", team, player)
+
+        print(f"{'function':<22}{'csv cold':>11}{'csv warm':>11}{'sql cold':>11}{'sql warm':>11}  identical")
+        for name in csv_results:
+            csv_value, sql_value = csv_results[name], sql_results[name]
+            if name == "load_team_ratings":
+                same = csv_value.current_ratings().equals(sql_value.current_ratings())
+            elif isinstance(csv_value, pd.DataFrame):
+                same = csv_value.reset_index(drop=True).equals(sql_value.reset_index(drop=True))
+            else:
+                same = csv_value == sql_value
+            timings = [*csv_timings[name], *sql_timings[name]]
+            print(f"{name:<22}" + "".join(f"{value * 1000:9.1f}ms" for value in timings) + f"  {same}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seasons", type=int, default=60, help="Number of synthetic seasons to generate")
+    args = parser.parse_args()
+    main(args.seasons)
@@ -0,0 +1,94 @@
+"""Time the Elo rating engine on a large synthetic game log.
+
+Example:
+    python scripts/benchmark_ratings.py --games 2000000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.ratings import EloRatings  # noqa: E402
+
+DAYS_PER_SEASON = 165
+
+
+def synthetic_games(n_games: int, n_teams: int, seed: int = 0) -> pd.DataFrame:
+    """Return ``n_games`` games in ``team_games.csv`` layout, both perspectives included."""
+    rng = np.random.default_rng(seed)
+    teams = [f"T{idx:04d}" for idx in range(n_teams)]
+    games_per_day = n_teams // 2
+    n_days = -(-n_games // games_per_day)
+    # Every team plays once per day against a random partner.
+    pairs = np.argsort(rng.random((n_days, n_teams)), axis=1)[:, : games_per_day * 2].reshape(-1, 2)[:n_games]
+    day = np.repeat(np.arange(n_days), games_per_day)[:n_games]
+    strength = rng.normal(0, 6, n_teams)
+    home_points = rng.normal(114, 11, n_games) + strength[pairs[:, 0]] + 2.5
+    away_points = rng.normal(114, 11, n_games) + strength[pairs[:, 1]]
+
+    home_rows = pd.DataFrame(
+        {
+            "date": pd.Timestamp("1950-01-01") + pd.to_timedelta(day, unit="D"),
+            "season": 1950 + day // DAYS_PER_SEASON,
+            "team": np.take(teams, pairs[:, 0]),
+            "opponent": np.take(teams, pairs[:, 1]),
+            "home": 1,
+            "team_points": home_points.round().astype(int),
+            "opponent_points": away_points.round().astype(int),
+        }
+    )
+    away_rows = home_rows.rename(
+        columns={
+            "team": "opponent",
+            "opponent": "team",
+            "team_points": "opponent_points",
+            "opponent_points": "team_points",
+        }
+    ).assign(home=0)
+    return pd.concat([home_rows, away_rows], ignore_index=True).sort_values("date", kind="stable")
+
+
+def main(n_games: int, n_teams: int) -> None:
+    games = synthetic_games(n_games, n_teams)
+    teams = games["team"].unique()
+    print(f"{n_games:,} games between {n_teams} teams ({len(games):,} mirrored rows)")
+
+    last_day = games["date"].max()
+    history = games[games["date"] < last_day]
+    latest = games[games["date"] == last_day]
+
+    start = time.perf_counter()
+    ratings = EloRatings()
+    ratings.update(history)
+    full = time.perf_counter() - start
+    print(f"full replay:        {full:8.3f}s ({n_games / full:,.0f} games/s)")
+
+    start = time.perf_counter()
+    ratings.update(latest)
+    incremental = time.perf_counter() - start
+    print(f"incremental day:    {incremental * 1000:8.3f}ms")
+
+    start = time.perf_counter()
+    table = ratings.history
+    print(f"history table:      {time.perf_counter() - start:8.3f}s ({len(table):,} rows)")
+
+    start = time.perf_counter()
+    for team in teams:
+        ratings.rating(team)
+    print(f"current rating:     {(time.perf_counter() - start) / len(teams) * 1e6:8.3f}us per lookup")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--games", type=int, default=2_000_000, help="Number of synthetic games to rate")
+    # A wide league keeps millions of games inside pandas' datetime range.
+    parser.add_argument("--teams", type=int, default=300, help="Number of synthetic teams")
+    args = parser.parse_args()
+    main(args.games, args.teams)
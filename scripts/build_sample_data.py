@@ -1,14 +1,59 @@
-"""Create bundled CSVs that include every NBA team using plausible sample data."""
+"""Create bundled CSVs that include every NBA team using plausible sample data.
+
+Player and game log tables are written as one file per season under
+``data/players/`` and ``data/team_games/``.
+"""
 from __future__ import annotations
 
+import argparse
 import csv
 import datetime as dt
 import random
+import sys
 from pathlib import Path
 
-DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.database import build_database  # noqa: E402
+from src.metrics import materialize_metrics  # noqa: E402
+from src.storage import DATA_DIR, clear_partitions, partition_path  # noqa: E402
+
 random.seed(42)
 
+PLAYER_COLUMNS = [
+    "player",
+    "team",
+    "position",
+    "season",
+    "games_played",
+    "minutes",
+    "points",
+    "rebounds",
+    "assists",
+    "steals",
+    "blocks",
+    "fg_pct",
+    "three_pct",
+    "ft_pct",
+    "usage_rate",
+    "win_shares",
+]
+
+TEAM_GAME_COLUMNS = [
+    "date",
+    "season",
+    "team",
+    "opponent",
+    "home",
+    "team_points",
+    "opponent_points",
+    "pace",
+    "offensive_rating",
+    "defensive_rating",
+    "rebound_pct",
+    "assist_ratio",
+]
+
 team_profiles = {
     "ATL": {"pace": 101.4, "off": 118.2, "def": 119.3, "reb": 49.4, "ast": 21.3},
     "BOS": {"pace": 99.1, "off": 122.5, "def": 110.4, "reb": 53.2, "ast": 20.8},
@@ -129,81 +174,70 @@ def _jitter(value: float, pct: float = 0.05) -> float:
     return value * (1 + random.uniform(-pct, pct))
 
 
-def build_players():
-    DATA_DIR.mkdir(exist_ok=True)
-    with open(DATA_DIR / "players.csv", "w", newline="") as f:
+def _write_season(table: str, season: int, header, rows) -> None:
+    path = partition_path(table, season)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="") as f:
         writer = csv.writer(f)
-        writer.writerow(
-            [
-                "player",
-                "team",
-                "position",
-                "season",
-                "games_played",
-                "minutes",
-                "points",
-                "rebounds",
-                "assists",
-                "steals",
-                "blocks",
-                "fg_pct",
-                "three_pct",
-                "ft_pct",
-                "usage_rate",
-                "win_shares",
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def build_players():
+    clear_partitions("players")
+    for season in SEASONS:
+        scale = _season_multiplier(season)
+        season_rows = []
+        for row in players:
+            (
+                name,
+                team,
+                position,
+                games,
+                minutes_base,
+                points,
+                rebounds,
+                assists,
+                steals,
+                blocks,
+                fg_pct_base,
+                three_pct_base,
+                ft_pct_base,
+                usage_base,
+                win_shares_base,
+            ) = row
+
+            games_played = max(45, int(_jitter(games * scale, 0.03)))
+            minutes = round(_jitter(minutes_base * scale, 0.04), 1)
+            stat_block = [
+                round(_jitter(points * scale, 0.05), 1),
+                round(_jitter(rebounds * scale, 0.05), 1),
+                round(_jitter(assists * scale, 0.05), 1),
+                round(_jitter(steals * scale, 0.06), 1),
+                round(_jitter(blocks * scale, 0.06), 1),
             ]
-        )
-        for season in SEASONS:
-            scale = _season_multiplier(season)
-            for row in players:
+            fg_pct = round(min(0.65, max(0.35, _jitter(fg_pct_base, 0.04))), 3)
+            three_pct = round(min(0.5, max(0.28, _jitter(three_pct_base, 0.06))), 3)
+            ft_pct = round(min(0.95, max(0.65, _jitter(ft_pct_base, 0.03))), 3)
+            usage = round(min(36.0, max(16.0, _jitter(usage_base, 0.05))), 1)
+            win_shares = round(_jitter(win_shares_base * scale, 0.08), 1)
+            season_rows.append(
                 (
                     name,
                     team,
                     position,
-                    games,
-                    minutes_base,
-                    points,
-                    rebounds,
-                    assists,
-                    steals,
-                    blocks,
-                    fg_pct_base,
-                    three_pct_base,
-                    ft_pct_base,
-                    usage_base,
-                    win_shares_base,
-                ) = row
-
-                games_played = max(45, int(_jitter(games * scale, 0.03)))
-                minutes = round(_jitter(minutes_base * scale, 0.04), 1)
-                stat_block = [
-                    round(_jitter(points * scale, 0.05), 1),
-                    round(_jitter(rebounds * scale, 0.05), 1),
-                    round(_jitter(assists * scale, 0.05), 1),
-                    round(_jitter(steals * scale, 0.06), 1),
-                    round(_jitter(blocks * scale, 0.06), 1),
-                ]
-                fg_pct = round(min(0.65, max(0.35, _jitter(fg_pct_base, 0.04))), 3)
-                three_pct = round(min(0.5, max(0.28, _jitter(three_pct_base, 0.06))), 3)
-                ft_pct = round(min(0.95, max(0.65, _jitter(ft_pct_base, 0.03))), 3)
-                usage = round(min(36.0, max(16.0, _jitter(usage_base, 0.05))), 1)
-                win_shares = round(_jitter(win_shares_base * scale, 0.08), 1)
-                writer.writerow(
-                    (
-                        name,
-                        team,
-                        position,
-                        season,
-                        games_played,
-                        minutes,
-                        *stat_block,
-                        fg_pct,
-                        three_pct,
-                        ft_pct,
-                        usage,
-                        win_shares,
-                    )
+                    season,
+                    games_played,
+                    minutes,
+                    *stat_block,
+                    fg_pct,
+                    three_pct,
+                    ft_pct,
+                    usage,
+                    win_shares,
                 )
+            )
+        _write_season("players", season, PLAYER_COLUMNS, season_rows)
 
 
 def build_team_games():
@@ -237,25 +271,9 @@ def build_team_games():
                         round(_jitter(metrics["ast"] * scale, 0.03), 1),
                     ]
                 )
-    with open(DATA_DIR / "team_games.csv", "w", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(
-            [
-                "date",
-                "season",
-                "team",
-                "opponent",
-                "home",
-                "team_points",
-                "opponent_points",
-                "pace",
-                "offensive_rating",
-                "defensive_rating",
-                "rebound_pct",
-                "assist_ratio",
-            ]
-        )
-        writer.writerows(rows)
+    clear_partitions("team_games")
+    for season in SEASONS:
+        _write_season("team_games", season, TEAM_GAME_COLUMNS, [row for row in rows if row[1] == season])
 
 
 def build_upcoming():
@@ -274,7 +292,15 @@ def build_upcoming():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sqlite", action="store_true", help="Also write data/analytics.sqlite for ANALYTICS_BACKEND=sqlite"
+    )
+    args = parser.parse_args()
     build_players()
     build_team_games()
     build_upcoming()
-    print("Sample data written to data/*.csv")
+    materialize_metrics()
+    print("Sample data written to data/players/, data/team_games/ and data/upcoming_games.csv")
+    if args.sqlite:
+        print(f"Database written to {build_database()}")
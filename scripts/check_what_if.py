@@ -0,0 +1,57 @@
+"""Sanity-check the what-if engine against the current data.
+
+For every team it checks that an unchanged roster reproduces the team summary
+and upcoming-game projections, and that sitting any player with positive win
+shares never raises the team's win probability (or lowers its opponents').
+Exits with status 1 and lists the offending scenarios when a check fails.
+Scenarios are re-scored through the fitted models, so the second check fails
+whenever the data gives offensive rating or the Elo gap a negative win weight
+(as the random results in the bundled sample data do).
+
+Example:
+    python scripts/check_what_if.py
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src import analytics  # noqa: E402
+
+
+def check_team(team: str) -> list:
+    problems = []
+    baseline = analytics.what_if(team)
+    if baseline.summary != analytics.compute_team_summary(team):
+        problems.append(f"{team}: unchanged roster does not reproduce the team summary")
+    upcoming = analytics.project_upcoming_games()
+    expected = upcoming[(upcoming["team"] == team) | (upcoming["opponent"] == team)].reset_index(drop=True)
+    if not baseline.projections.equals(expected):
+        problems.append(f"{team}: unchanged roster does not reproduce the upcoming projections")
+
+    players = analytics.load_player_data(analytics.latest_season("players"))
+    roster = players[players["team"] == team].drop_duplicates("player")
+    is_team = (baseline.projections["team"] == team).to_numpy()
+    base_probability = baseline.projections["win_probability"].to_numpy()
+    for player in roster.loc[roster["win_shares"] > 0, "player"]:
+        probability = analytics.what_if(team, removed=[player]).projections["win_probability"].to_numpy()
+        # The team's own rows must not go up and its opponents' rows must not go down.
+        if np.any(np.where(is_team, probability > base_probability, probability < base_probability)):
+            problems.append(f"{team}: sitting {player} improves the team's win probability")
+    return problems
+
+
+def main() -> int:
+    problems = [problem for team in analytics.team_list() for problem in check_team(team)]
+    for problem in problems:
+        print(problem)
+    print(f"{len(problems)} problem(s) across {len(analytics.team_list())} teams")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
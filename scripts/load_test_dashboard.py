@@ -0,0 +1,197 @@
+"""Load-test the Streamlit dashboard with many concurrent scripted sessions.
+
+Each session is a separate process driving ``app.py`` through Streamlit's
+``AppTest`` harness (which cannot share a process between sessions).  Sessions
+switch teams, type searches, open player projections, sit players and try
+hypothetical matchups against synthetic data sets of increasing size, and the script
+reports rerun latency percentiles, time spent in each ``analytics`` call and
+peak process memory.
+
+The defaults finish in a couple of minutes.  Every session trains the
+projection models on its first render, so that line grows with the data size
+(about 50s per session at 64 seasons).
+
+Example:
+    python scripts/load_test_dashboard.py --sessions 4 --steps 10 --seasons 4 16 64
+"""
+from __future__ import annotations
+
+import argparse
+import multiprocessing as mp
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from benchmark_backends import synthetic_tables  # noqa: E402
+from src import storage  # noqa: E402
+
+# Dashboard entry points that get their own timing line.
+SECTIONS = [
+    "team_list",
+    "compute_team_summary",
+    "team_trend",
+    "search_players",
+    "player_projection",
+    "project_upcoming_games",
+    "project_matchup",
+    "strength_of_schedule",
+    "what_if",
+]
+ACTIONS = ["switch_team", "search", "pick_player", "matchup", "sit_player"]
+
+
+def _instrument(analytics, timings: Dict[str, List[float]]) -> None:
+    for name in SECTIONS:
+        func = getattr(analytics, name)
+
+        def timed(*args, _func=func, _name=name, **kwargs):
+            start = time.perf_counter()
+            try:
+                return _func(*args, **kwargs)
+            finally:
+                timings[_name].append(time.perf_counter() - start)
+
+        setattr(analytics, name, timed)
+
+
+def _widget(elements, label: str):
+    return next((element for element in elements if element.label == label), None)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def run_session(session_id: int, steps: int) -> Dict:
+    """Drive one dashboard session and return its raw measurements."""
+    from streamlit.testing.v1 import AppTest
+
+    from src import analytics
+
+    section_timings: Dict[str, List[float]] = defaultdict(list)
+    _instrument(analytics, section_timings)
+    rng = random.Random(session_id)
+
+    app = AppTest.from_file(str(ROOT / "app.py"), default_timeout=600)
+    start = time.perf_counter()
+    app.run()
+    first_render = time.perf_counter() - start
+
+    teams = list(_widget(app.selectbox, "Select a team").options)
+    players = list(analytics.load_player_data()["player"].unique())
+    reruns: Dict[str, List[float]] = defaultdict(list)
+    errors = 0
+
+    for _ in range(steps):
+        action = rng.choice(ACTIONS)
+        if action == "switch_team":
+            _widget(app.selectbox, "Select a team").set_value(rng.choice(teams))
+        elif action == "search":
+            query = rng.choice([rng.choice(players)[: rng.randint(2, 6)], rng.choice(teams), ""])
+            _widget(app.text_input, "Search by player or team").input(query)
+        elif action == "pick_player":
+            picker = _widget(app.selectbox, "Choose a player for projections")
+            if picker is None or not picker.options:
+                continue
+            picker.set_value(rng.choice(list(picker.options)))
+        elif action == "sit_player":
+            sit = _widget(app.multiselect, "Sit players")
+            if not sit.options:
+                continue
+            sit.set_value([rng.choice(list(sit.options))])
+        else:
+            opponent = _widget(app.selectbox, "Opponent")
+            opponent.set_value(rng.choice(list(opponent.options)))
+            _widget(app.radio, "Venue").set_value(rng.choice(["Home", "Away"]))
+
+        start = time.perf_counter()
+        app.run()
+        reruns[action].append(time.perf_counter() - start)
+        errors += len(app.exception)
+
+    return {
+        "first_render": first_render,
+        "reruns": dict(reruns),
+        "sections": dict(section_timings),
+        "peak_rss_mb": _peak_rss_mb(),
+        "errors": errors,
+    }
+
+
+def _session_worker(args) -> Dict:
+    return run_session(*args)
+
+
+def _percentiles(values: List[float]) -> str:
+    if not values:
+        return "      n/a"
+    p50, p95, p99 = np.percentile(np.asarray(values) * 1000, [50, 95, 99])
+    return f"{p50:8.1f} {p95:8.1f} {p99:8.1f} {max(values) * 1000:8.1f}"
+
+
+def run_size(n_seasons: int, sessions: int, steps: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        players, games = synthetic_tables(n_seasons)
+        storage.write_partitions(players, "players", data_dir)
+        storage.write_partitions(games, "team_games", data_dir)
+        (data_dir / "upcoming_games.csv").write_text((ROOT / "data" / "upcoming_games.csv").read_text())
+
+        # Spawned workers import ``src`` fresh and so pick up this data folder.
+        os.environ["ANALYTICS_DATA_DIR"] = tmp
+        # One task per worker: every session starts from a fresh interpreter and cold caches.
+        with mp.get_context("spawn").Pool(sessions, maxtasksperchild=1) as pool:
+            start = time.perf_counter()
+            results = pool.map(_session_worker, [(session_id, steps) for session_id in range(sessions)])
+            wall = time.perf_counter() - start
+
+    first_renders = [result["first_render"] for result in results]
+    reruns = defaultdict(list)
+    sections = defaultdict(list)
+    for result in results:
+        for action, values in result["reruns"].items():
+            reruns[action].extend(values)
+        for name, values in result["sections"].items():
+            sections[name].extend(values)
+    all_reruns = [value for values in reruns.values() for value in values]
+    rss = [result["peak_rss_mb"] for result in results]
+
+    print(
+        f"\n=== {n_seasons} seasons ({len(players):,} player rows, {len(games):,} game rows), "
+        f"{sessions} sessions x {steps} steps in {wall:.1f}s ==="
+    )
+    print(f"{'':<24}{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}  count")
+    print(f"{'first render':<24}{_percentiles(first_renders)}  {len(first_renders)}")
+    print(f"{'rerun (all)':<24}{_percentiles(all_reruns)}  {len(all_reruns)}")
+    for action in ACTIONS:
+        print(f"{'  ' + action:<24}{_percentiles(reruns[action])}  {len(reruns[action])}")
+    print("sections")
+    for name in SECTIONS:
+        print(f"{'  ' + name:<24}{_percentiles(sections[name])}  {len(sections[name])}")
+    print(f"peak RSS per session: mean {np.mean(rss):.0f} MB, max {max(rss):.0f} MB")
+    print(f"app exceptions: {sum(result['errors'] for result in results)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=4, help="Concurrent dashboard sessions")
+    parser.add_argument("--steps", type=int, default=10, help="Interactions scripted per session")
+    parser.add_argument(
+        "--seasons", type=int, nargs="+", default=[4, 16], help="Synthetic data sizes to test, in seasons"
+    )
+    args = parser.parse_args()
+    for n_seasons in args.seasons:
+        run_size(n_seasons, args.sessions, args.steps)
@@ -1,5 +1,8 @@
 """Download up-to-date NBA data and refresh the local CSV files.
 
+Player stats and game logs are written as one file per season, so running with
+``--past-seasons 0`` only rewrites the active season's partition.
+
 This script relies on the public `nba_api` package, which scrapes the same
 endpoints used by NBA.com.  The requests can occasionally be throttled, so if
 you receive HTTP 429 errors simply wait a few seconds and retry.
@@ -8,6 +11,7 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import sys
 import time
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -22,7 +26,12 @@ from nba_api.stats.endpoints import (
 from nba_api.stats.library.parameters import Season
 from nba_api.stats.static import teams as static_teams
 
-DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.database import write_ratings, write_table  # noqa: E402
+from src.metrics import ensure_player_metrics, ensure_team_metrics  # noqa: E402
+from src.storage import DATA_DIR, write_partitions  # noqa: E402
+
 DEFAULT_SEASON = Season.current_season
 
 
@@ -210,26 +219,40 @@ def determine_recent_seasons(
 
 
 def refresh(
-    season: str, past_seasons: Optional[int], since_season: Optional[int], games_per_team: int, days_ahead: int
+    season: str,
+    past_seasons: Optional[int],
+    since_season: Optional[int],
+    games_per_team: int,
+    days_ahead: int,
+    sqlite: bool = False,
 ) -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     seasons = determine_recent_seasons(season, past_seasons, since_season)
 
-    player_frames: List[pd.DataFrame] = []
+    # Each season lands in its own partition, so older seasons that were not
+    # requested this run are left untouched on disk.
+    player_rows = 0
     for season_str in seasons:
         print(f"Fetching player stats for {season_str}...")
-        player_frames.append(fetch_player_stats(season_str))
-    players = pd.concat(player_frames, ignore_index=True)
-    players.to_csv(DATA_DIR / "players.csv", index=False)
-    print(f"Saved {len(players)} player rows across {len(seasons)} seasons")
-
-    team_frames: List[pd.DataFrame] = []
+        players = ensure_player_metrics(fetch_player_stats(season_str))
+        write_partitions(players, "players")
+        if sqlite:
+            write_table(players, "players")
+        player_rows += len(players)
+    print(f"Saved {player_rows} player rows across {len(seasons)} seasons")
+
+    game_rows = 0
     for season_str in seasons:
         print(f"Fetching {games_per_team} recent games for every team in {season_str}...")
-        team_frames.append(fetch_team_games(season_str, games_per_team))
-    team_games = pd.concat(team_frames, ignore_index=True)
-    team_games.to_csv(DATA_DIR / "team_games.csv", index=False)
-    print(f"Saved {len(team_games)} team game rows across {len(seasons)} seasons")
+        team_games = ensure_team_metrics(fetch_team_games(season_str, games_per_team))
+        write_partitions(team_games, "team_games")
+        if sqlite:
+            write_table(team_games, "team_games")
+        game_rows += len(team_games)
+    print(f"Saved {game_rows} team game rows across {len(seasons)} seasons")
+    if sqlite:
+        # One replay over the full stored history once every season is in.
+        write_ratings()
 
     print(f"Fetching scheduled games for next {days_ahead} days...")
     upcoming = fetch_upcoming_games(days_ahead)
@@ -256,5 +279,8 @@ if __name__ == "__main__":
         "--games-per-team", type=int, default=6, help="Number of recent games to include per team per season"
     )
     parser.add_argument("--days-ahead", type=int, default=5, help="How many days ahead to pull schedule data")
+    parser.add_argument(
+        "--sqlite", action="store_true", help="Also update data/analytics.sqlite for ANALYTICS_BACKEND=sqlite"
+    )
     args = parser.parse_args()
-    refresh(args.season, args.past_seasons, args.since_season, args.games_per_team, args.days_ahead)
+    refresh(args.season, args.past_seasons, args.since_season, args.games_per_team, args.days_ahead, args.sqlite)
@@ -1,30 +1,62 @@
 """Utility functions for working with the sample NBA analytics data."""
 from __future__ import annotations
 
+import hashlib
 from functools import lru_cache
-from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, NamedTuple, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 from sklearn.linear_model import LinearRegression, LogisticRegression
+from sklearn.pipeline import Pipeline, make_pipeline
+from sklearn.preprocessing import StandardScaler
 
-DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+from . import database
+from .metrics import ensure_player_metrics, ensure_team_metrics
+from .ratings import EloRatings, build_ratings
+from .storage import DATA_DIR, SeasonFilter, available_seasons, read_table, season_key
 
 
-@lru_cache(maxsize=1)
-def load_player_data() -> pd.DataFrame:
-    """Return the cached player level data set."""
-    return pd.read_csv(DATA_DIR / "players.csv")
+def load_player_data(seasons: SeasonFilter = None) -> pd.DataFrame:
+    """Return the cached player level data set, optionally limited to ``seasons``."""
+    return _load_players(season_key(seasons))
 
 
-@lru_cache(maxsize=1)
-def load_game_data() -> pd.DataFrame:
-    """Return the cached team game log data set."""
-    games = pd.read_csv(DATA_DIR / "team_games.csv")
+@lru_cache(maxsize=8)
+def _load_players(seasons: Optional[Tuple[int, ...]]) -> pd.DataFrame:
+    if database.sql_backend_enabled():
+        return ensure_player_metrics(database.read_table("players", seasons))
+    return ensure_player_metrics(read_table("players", seasons))
+
+
+def load_game_data(seasons: SeasonFilter = None) -> pd.DataFrame:
+    """Return the cached team game log data set, optionally limited to ``seasons``."""
+    return _load_games(season_key(seasons))
+
+
+@lru_cache(maxsize=8)
+def _load_games(seasons: Optional[Tuple[int, ...]]) -> pd.DataFrame:
+    if database.sql_backend_enabled():
+        games = database.read_table("team_games", seasons)
+    else:
+        games = read_table("team_games", seasons)
+    games = ensure_team_metrics(games)
     games["date"] = pd.to_datetime(games["date"])
     return games
 
 
+@lru_cache(maxsize=None)
+def latest_season(table: str) -> int:
+    """Return the most recent season stored for ``table`` without loading it.
+
+    Cached like the loaders: on a single legacy CSV finding it means reading the
+    file's whole ``season`` column.
+    """
+    if database.sql_backend_enabled():
+        return database.available_seasons(table)[-1]
+    return available_seasons(table)[-1]
+
+
 @lru_cache(maxsize=1)
 def load_upcoming_games() -> pd.DataFrame:
     """Return the cached list of upcoming matchups."""
@@ -33,20 +65,53 @@ def load_upcoming_games() -> pd.DataFrame:
     return upcoming
 
 
+# Built on first use by load_team_ratings() and dropped by clear_caches().
+_team_ratings: Optional[EloRatings] = None
+
+
+def load_team_ratings() -> EloRatings:
+    """Return Elo ratings fitted over the cached game log.
+
+    Call ``load_team_ratings().update(new_games)`` to fold in newly played games
+    without replaying the full history; the matchup matrix and what-if baselines
+    are keyed on the ratings' ``version`` and pick the new ratings up on their
+    next call.
+    """
+    global _team_ratings
+    if _team_ratings is None:
+        _team_ratings = build_ratings(load_game_data())
+    return _team_ratings
+
+
+def team_ratings_loaded() -> bool:
+    """Return ``True`` once :func:`load_team_ratings` has built the ratings in this process."""
+    return _team_ratings is not None
+
+
+def _current_elo(team: str) -> float:
+    # The SQL backend keeps current ratings in a table, so the summary does not
+    # have to load every season's games just for one number.  Once the ratings
+    # are in memory (and possibly updated since) they win.
+    if database.sql_backend_enabled() and not team_ratings_loaded():
+        stored = database.team_rating(team)
+        if stored is not None:
+            return stored
+    return load_team_ratings().rating(team)
+
+
 def team_list() -> Iterable[str]:
     return sorted(load_player_data()["team"].unique())
 
 
 def compute_team_summary(team: str) -> Dict[str, float]:
     """Aggregate a mix of traditional and advanced metrics for a team."""
-    players = load_player_data()
-    games = load_game_data()
-
-    latest_player_season = players["season"].max()
-    latest_game_season = games["season"].max()
-
-    season_players = players[(players["team"] == team) & (players["season"] == latest_player_season)]
-    team_games = games[(games["team"] == team) & (games["season"] == latest_game_season)]
+    if database.sql_backend_enabled():
+        season_players, team_games = database.team_season_rows(team)
+    else:
+        players = load_player_data(latest_season("players"))
+        games = load_game_data(latest_season("team_games"))
+        season_players = players[players["team"] == team]
+        team_games = games[games["team"] == team]
 
     # Weight usage by minutes so high-minute players drive the team usage estimate.
     if not season_players.empty and season_players["minutes"].sum() > 0:
@@ -67,6 +132,8 @@ def compute_team_summary(team: str) -> Dict[str, float]:
         "Def Rating": team_games["defensive_rating"].mean(),
         "Pace": team_games["pace"].mean(),
         "Rebound %": team_games["rebound_pct"].mean(),
+        "Net Rating": team_games["net_rating"].mean(),
+        "Elo": _current_elo(team),
     }
 
     return {k: round(v, 2) for k, v in summary.items()}
@@ -74,32 +141,37 @@ def compute_team_summary(team: str) -> Dict[str, float]:
 
 def search_players(query: str) -> pd.DataFrame:
     """Return a filtered player table for the supplied search query."""
-    players = load_player_data()
     if not query:
-        return players
+        return load_player_data()
+    if database.sql_backend_enabled():
+        return database.search_players(query)
+    players = load_player_data()
     mask = players["player"].str.contains(query, case=False, na=False)
     mask |= players["team"].str.contains(query, case=False, na=False)
     return players[mask]
 
 
-def calculate_true_shooting(fg_pct: float, three_pct: float, ft_pct: float) -> float:
-    return (fg_pct + three_pct + ft_pct) / 3
-
-
 def player_projection(player_name: str) -> Dict[str, float]:
     """Estimate per-game production by blending season data and usage."""
-    players = load_player_data()
-    player_row = players[players["player"] == player_name]
-    if player_row.empty:
-        raise ValueError(f"Unknown player: {player_name}")
-    row = player_row.iloc[0]
-
-    usage_delta = row["usage_rate"] - players["usage_rate"].mean()
+    if database.sql_backend_enabled():
+        row, mean_usage, mean_minutes = database.player_projection_inputs(player_name)
+        if row is None:
+            raise ValueError(f"Unknown player: {player_name}")
+    else:
+        players = load_player_data()
+        player_row = players[players["player"] == player_name]
+        if player_row.empty:
+            raise ValueError(f"Unknown player: {player_name}")
+        row = player_row.iloc[0]
+        mean_usage = players["usage_rate"].mean()
+        mean_minutes = players["minutes"].mean()
+
+    usage_delta = row["usage_rate"] - mean_usage
     projection_multiplier = 1 + (usage_delta / 100)
     projected_points = row["points"] * projection_multiplier
-    projected_rebounds = row["rebounds"] * (row["minutes"] / players["minutes"].mean())
+    projected_rebounds = row["rebounds"] * (row["minutes"] / mean_minutes)
     projected_assists = row["assists"] * projection_multiplier
-    true_shooting = calculate_true_shooting(row["fg_pct"], row["three_pct"], row["ft_pct"])
+    true_shooting = row["true_shooting"]
 
     return {
         "Projected Points": round(projected_points, 1),
@@ -109,9 +181,31 @@ def player_projection(player_name: str) -> Dict[str, float]:
     }
 
 
+def _elo_diff(elo, opp_elo):
+    # Rating gap in units of the Elo logistic scale, so it sits near the other features' magnitudes.
+    return (elo - opp_elo) / 400.0
+
+
+FEATURE_COLUMNS = [
+    "home",
+    "pace",
+    "offensive_rating",
+    "defensive_rating",
+    "rebound_pct",
+    "assist_ratio",
+    "opp_off_rating",
+    "opp_def_rating",
+    "elo_diff",
+]
+TEAM_PROFILE_COLUMNS = ["pace", "offensive_rating", "defensive_rating", "rebound_pct", "assist_ratio"]
+
+
 def _prepare_team_features() -> Tuple[pd.DataFrame, pd.Series, pd.Series]:
     games = load_game_data().copy()
-    opponent_features = games[["team", "season", "offensive_rating", "defensive_rating"]]
+    # One row per opponent and season keeps the training set at one row per team-game.
+    opponent_features = (
+        games.groupby(["team", "season"])[["offensive_rating", "defensive_rating"]].mean().reset_index()
+    )
     opponent_features = opponent_features.rename(
         columns={
             "team": "opponent",
@@ -120,86 +214,374 @@ def _prepare_team_features() -> Tuple[pd.DataFrame, pd.Series, pd.Series]:
         }
     )
     merged = games.merge(opponent_features, on=["opponent", "season"], how="left")
-    merged["win"] = (merged["team_points"] > merged["opponent_points"]).astype(int)
-
-    feature_cols = [
-        "home",
-        "pace",
-        "offensive_rating",
-        "defensive_rating",
-        "rebound_pct",
-        "assist_ratio",
-        "opp_off_rating",
-        "opp_def_rating",
-    ]
+    pregame = load_team_ratings().pregame.drop_duplicates(["date", "team", "opponent"])
+    merged = merged.merge(pregame, on=["date", "team", "opponent"], how="left")
+    merged["elo_diff"] = _elo_diff(merged["elo"], merged["opp_elo"])
+
+    feature_cols = FEATURE_COLUMNS
     merged[feature_cols] = merged[feature_cols].fillna(merged[feature_cols].mean())
 
     return merged[feature_cols], merged["team_points"], merged["win"]
 
 
 @lru_cache(maxsize=1)
-def _train_models() -> Tuple[LinearRegression, LogisticRegression]:
+def _train_models() -> Tuple[Pipeline, Pipeline]:
     X, y_points, y_result = _prepare_team_features()
-    reg_model = LinearRegression().fit(X, y_points)
-    clf_model = LogisticRegression(max_iter=500).fit(X, y_result)
+    # Standardised inputs let the classifier converge despite features on very different scales.
+    reg_model = make_pipeline(StandardScaler(), LinearRegression()).fit(X, y_points)
+    clf_model = make_pipeline(StandardScaler(), LogisticRegression(max_iter=500)).fit(X, y_result)
     return reg_model, clf_model
 
 
+def model_version() -> str:
+    """Return a short fingerprint of the fitted projection models."""
+    reg_model, clf_model = _train_models()
+    digest = hashlib.sha1()
+    for model in (reg_model, clf_model):
+        scaler, estimator = model[0], model[-1]
+        for array in (scaler.mean_, scaler.scale_, estimator.coef_, estimator.intercept_):
+            digest.update(np.ascontiguousarray(array, dtype=float).tobytes())
+    return digest.hexdigest()[:12]
+
+
+class MatchupMatrix(NamedTuple):
+    """Projections for every ordered team pair at home and on the road.
+
+    Both arrays are indexed ``[home, team, opponent]`` where ``home`` is 0 for a
+    road game and 1 for a home game, and team positions follow ``teams``.
+    """
+
+    version: str
+    ratings_version: int
+    teams: Tuple[str, ...]
+    projected_points: np.ndarray
+    win_probability: np.ndarray
+
+    def index(self, teams: Iterable[str]) -> np.ndarray:
+        """Return matrix positions for ``teams`` (raises ``KeyError`` for unknown teams)."""
+        teams = list(teams)
+        positions = pd.Index(self.teams).get_indexer(teams)
+        if (positions < 0).any():
+            missing = [team for team, pos in zip(teams, positions) if pos < 0]
+            raise KeyError(f"Unknown team(s): {', '.join(missing)}")
+        return positions
+
+
+def matchup_matrix() -> MatchupMatrix:
+    """Return projections for all team pairs, cached per model and ratings version."""
+    return _build_matchup_matrix(model_version(), load_team_ratings().version)
+
+
+@lru_cache(maxsize=1)
+def _team_profiles(ratings_version: int) -> pd.DataFrame:
+    """Per-team model inputs (all-season profile means plus current Elo) indexed by team.
+
+    ``ratings_version`` is only the cache key; the ratings are read from
+    :func:`load_team_ratings`.
+    """
+    games = load_game_data()
+    profiles = games[["team", *TEAM_PROFILE_COLUMNS]].groupby("team").mean()
+    ratings = load_team_ratings()
+    profiles["elo"] = [ratings.rating(team) for team in profiles.index]
+    return profiles
+
+
+@lru_cache(maxsize=4)
+def _build_matchup_matrix(version: str, ratings_version: int) -> MatchupMatrix:
+    reg_model, clf_model = _train_models()
+    team_lookup = _team_profiles(ratings_version)
+    teams = tuple(team_lookup.index)
+    n_teams = len(teams)
+
+    elo = team_lookup["elo"].to_numpy()
+    profile = team_lookup[TEAM_PROFILE_COLUMNS].to_numpy()
+    opp_profile = team_lookup[["offensive_rating", "defensive_rating"]].to_numpy()
+
+    # Broadcast every block of the feature vector to (home, team, opponent, width).
+    shape = (2, n_teams, n_teams)
+    blocks = [
+        np.broadcast_to(np.arange(2)[:, None, None, None], (*shape, 1)),
+        np.broadcast_to(profile[None, :, None, :], (*shape, profile.shape[1])),
+        np.broadcast_to(opp_profile[None, None, :, :], (*shape, opp_profile.shape[1])),
+        np.broadcast_to(_elo_diff(elo[None, :, None, None], elo[None, None, :, None]), (*shape, 1)),
+    ]
+    features = pd.DataFrame(
+        np.concatenate(blocks, axis=-1).reshape(-1, len(FEATURE_COLUMNS)), columns=FEATURE_COLUMNS
+    )
+
+    projected_points = reg_model.predict(features).reshape(shape)
+    win_probability = clf_model.predict_proba(features)[:, 1].reshape(shape)
+    return MatchupMatrix(version, ratings_version, teams, projected_points, win_probability)
+
+
+def project_matchup(team: str, opponent: str, home: bool = True) -> Dict[str, float]:
+    """Return the projection for any hypothetical matchup."""
+    matrix = matchup_matrix()
+    team_pos, opp_pos = matrix.index([team, opponent])
+    venue = int(bool(home))
+    return {
+        "Projected Points": round(float(matrix.projected_points[venue, team_pos, opp_pos]), 1),
+        "Opponent Projected Points": round(float(matrix.projected_points[1 - venue, opp_pos, team_pos]), 1),
+        "Win Probability": round(float(matrix.win_probability[venue, team_pos, opp_pos]), 3),
+    }
+
+
 def project_upcoming_games() -> pd.DataFrame:
     """Return predictions for every entry in the upcoming games file."""
-    reg_model, clf_model = _train_models()
-    feature_cols, _, _ = _prepare_team_features()
-    upcoming = load_upcoming_games().copy()
-
-    opponent_lookup = (
-        load_game_data()[["team", "season", "offensive_rating", "defensive_rating"]]
-        .groupby("team")
-        .mean()
-        .rename(columns={
-            "offensive_rating": "opp_off_rating",
-            "defensive_rating": "opp_def_rating",
-        })
+    matrix = matchup_matrix()
+    upcoming = load_upcoming_games()
+
+    venue = upcoming["home"].to_numpy(dtype=int)
+    team_pos = matrix.index(upcoming["team"])
+    opp_pos = matrix.index(upcoming["opponent"])
+
+    return pd.DataFrame(
+        {
+            "date": upcoming["date"],
+            "team": upcoming["team"],
+            "opponent": upcoming["opponent"],
+            "home": upcoming["home"].astype(bool),
+            "projected_points": matrix.projected_points[venue, team_pos, opp_pos].round(1),
+            "win_probability": matrix.win_probability[venue, team_pos, opp_pos].round(3),
+        }
     )
 
-    team_lookup = (
-        load_game_data()[["team", "pace", "offensive_rating", "defensive_rating", "rebound_pct", "assist_ratio"]]
-        .groupby("team")
-        .mean()
+
+def strength_of_schedule(team: str, season: Optional[int] = None) -> float:
+    """Average projected win probability of ``team``'s opponents in a season's games.
+
+    Defaults to the latest season.  Each game is looked up in the matchup matrix
+    from the opponent's side, so higher values mean a tougher schedule.
+    """
+    season = latest_season("team_games") if season is None else season
+    games = load_game_data(season)
+    schedule = games[games["team"] == team]
+    if schedule.empty:
+        return float("nan")
+    matrix = matchup_matrix()
+    opp_pos = matrix.index(schedule["opponent"])
+    team_pos = matrix.index([team])[0]
+    opp_venue = 1 - schedule["home"].to_numpy(dtype=int)
+    return round(float(matrix.win_probability[opp_venue, opp_pos, team_pos].mean()), 3)
+
+
+# Share of a sidelined player's scoring the rest of the roster is assumed to absorb.
+# This is an assumption, not a fitted value: the midpoint between teammates making
+# up none of the lost points and all of them.
+REPLACEMENT_SHARE = 0.5
+GAMES_PER_SEASON = 82
+# Elo points per season win share.  One win share is one extra win, i.e. 1/82 on the
+# season win rate; near even odds the Elo expected-score curve rises ln(10) / 1600
+# per rating point, so a win share is worth 1600 / (82 * ln 10) ~= 8.5 points.
+ELO_PER_WIN_SHARE = 1600 / (GAMES_PER_SEASON * np.log(10))
+
+
+class WhatIfResult(NamedTuple):
+    """Team summary and upcoming-game projections under a roster scenario."""
+
+    summary: Dict[str, float]
+    projections: pd.DataFrame
+
+
+class _TeamBaseline(NamedTuple):
+    player_index: Dict[str, int]
+    minutes: np.ndarray
+    usage: np.ndarray
+    win_shares: np.ndarray
+    points: np.ndarray
+    minutes_total: float
+    usage_minutes_total: float
+    win_shares_total: float
+    active_players: int
+    ppg: float
+    off_rating: float
+    net_rating: float
+    summary: Dict[str, float]
+    upcoming: pd.DataFrame
+    features: np.ndarray
+    is_team: np.ndarray
+    is_opponent: np.ndarray
+    reg_coef: np.ndarray
+    reg_intercept: float
+    clf_coef: np.ndarray
+    clf_intercept: float
+
+
+def team_roster(team: str) -> pd.Series:
+    """Return minutes per game for the team's latest-season players, indexed by name."""
+    players = load_player_data(latest_season("players"))
+    roster = players[players["team"] == team].drop_duplicates("player")
+    return roster.set_index("player")["minutes"]
+
+
+def _linear_terms(model: Pipeline) -> Tuple[np.ndarray, float]:
+    """Fold a scaler + linear model pipeline into raw-feature coefficients and intercept."""
+    scaler, estimator = model[0], model[-1]
+    coef = np.ravel(estimator.coef_) / scaler.scale_
+    intercept = float(np.ravel(estimator.intercept_)[0] - coef @ scaler.mean_)
+    return coef, intercept
+
+
+@lru_cache(maxsize=32)
+def _what_if_baseline(version: str, ratings_version: int, team: str) -> _TeamBaseline:
+    players = load_player_data(latest_season("players"))
+    roster = players[players["team"] == team].drop_duplicates("player")
+    games = load_game_data(latest_season("team_games"))
+    team_games = games[games["team"] == team]
+
+    minutes = roster["minutes"].to_numpy(dtype=float)
+    usage = roster["usage_rate"].to_numpy(dtype=float)
+
+    # Upcoming games where the team appears on either side, with their model features.
+    upcoming = load_upcoming_games()
+    upcoming = upcoming[(upcoming["team"] == team) | (upcoming["opponent"] == team)]
+    profiles = _team_profiles(ratings_version)
+    team_rows = profiles.loc[upcoming["team"]]
+    opp_rows = profiles.loc[upcoming["opponent"]]
+    features = pd.DataFrame(
+        {
+            "home": upcoming["home"].to_numpy(dtype=float),
+            **{column: team_rows[column].to_numpy() for column in TEAM_PROFILE_COLUMNS},
+            "opp_off_rating": opp_rows["offensive_rating"].to_numpy(),
+            "opp_def_rating": opp_rows["defensive_rating"].to_numpy(),
+            "elo_diff": _elo_diff(team_rows["elo"].to_numpy(), opp_rows["elo"].to_numpy()),
+        }
+    )[FEATURE_COLUMNS].to_numpy()
+
+    reg_model, clf_model = _train_models()
+    reg_coef, reg_intercept = _linear_terms(reg_model)
+    clf_coef, clf_intercept = _linear_terms(clf_model)
+    return _TeamBaseline(
+        player_index={name: pos for pos, name in enumerate(roster["player"])},
+        minutes=minutes,
+        usage=usage,
+        win_shares=roster["win_shares"].to_numpy(dtype=float),
+        points=roster["points"].to_numpy(dtype=float),
+        minutes_total=float(minutes.sum()),
+        usage_minutes_total=float((usage * minutes).sum()),
+        win_shares_total=float(roster["win_shares"].sum()),
+        active_players=int(np.count_nonzero(minutes > 0)),
+        ppg=float(team_games["team_points"].mean()),
+        off_rating=float(team_games["offensive_rating"].mean()),
+        net_rating=float(team_games["net_rating"].mean()),
+        summary=compute_team_summary(team),
+        upcoming=upcoming[["date", "team", "opponent", "home"]].reset_index(drop=True),
+        features=features,
+        is_team=(upcoming["team"] == team).to_numpy(),
+        is_opponent=(upcoming["opponent"] == team).to_numpy(),
+        reg_coef=reg_coef,
+        reg_intercept=reg_intercept,
+        clf_coef=clf_coef,
+        clf_intercept=clf_intercept,
     )
 
-    rows = []
-    for _, matchup in upcoming.iterrows():
-        team_profile = team_lookup.loc[matchup["team"]]
-        opp_profile = opponent_lookup.loc[matchup["opponent"]]
-        features = {
-            "home": matchup["home"],
-            "pace": team_profile["pace"],
-            "offensive_rating": team_profile["offensive_rating"],
-            "defensive_rating": team_profile["defensive_rating"],
-            "rebound_pct": team_profile["rebound_pct"],
-            "assist_ratio": team_profile["assist_ratio"],
-            "opp_off_rating": opp_profile["opp_off_rating"],
-            "opp_def_rating": opp_profile["opp_def_rating"],
+
+def what_if(
+    team: str, removed: Iterable[str] = (), minutes: Optional[Dict[str, float]] = None
+) -> WhatIfResult:
+    """Re-project a team with some players sidelined or their minutes changed.
+
+    ``removed`` players drop to zero minutes and ``minutes`` maps players to new
+    minutes per game.  Only the affected players' contributions are subtracted
+    from the team's cached roster totals.  The team's offensive rating and Elo
+    gap are adjusted in its own upcoming matchups, which are then re-scored
+    through the projection models.
+    """
+    base = _what_if_baseline(model_version(), load_team_ratings().version, team)
+    new_minutes = dict(minutes or {})
+    new_minutes.update({player: 0.0 for player in removed})
+    unknown = [player for player in new_minutes if player not in base.player_index]
+    if unknown:
+        raise ValueError(f"Unknown player(s) for {team}: {', '.join(unknown)}")
+    negative = [player for player, value in new_minutes.items() if value < 0]
+    if negative:
+        raise ValueError(f"Minutes cannot be negative: {', '.join(negative)}")
+
+    positions = np.array([base.player_index[player] for player in new_minutes], dtype=int)
+    old = base.minutes[positions]
+    new = np.array(list(new_minutes.values()), dtype=float)
+    delta = new - old
+    # Counting stats scale with playing time; a player with no baseline minutes adds nothing.
+    kept = np.divide(new, old, out=np.zeros_like(new), where=old > 0)
+
+    minutes_total = base.minutes_total + delta.sum()
+    usage_minutes = base.usage_minutes_total + (base.usage[positions] * delta).sum()
+    win_shares = base.win_shares_total - (base.win_shares[positions] * (1 - kept)).sum()
+    lost_points = (base.points[positions] * (1 - kept)).sum()
+    active = base.active_players - np.count_nonzero((old > 0) & (new <= 0))
+    active += np.count_nonzero((old <= 0) & (new > 0))
+
+    off_factor = 1 - (1 - REPLACEMENT_SHARE) * lost_points / base.ppg if base.ppg > 0 else 1.0
+    elo_delta = ELO_PER_WIN_SHARE * (win_shares - base.win_shares_total)
+
+    summary = dict(base.summary)
+    summary.update(
+        {
+            "PPG": round(base.ppg * off_factor, 2),
+            "Usage": round(usage_minutes / minutes_total, 2) if minutes_total > 0 else float("nan"),
+            "Win Shares": round(win_shares, 2),
+            "Avg Minutes": round(minutes_total / active, 2) if active else float("nan"),
+            "Off Rating": round(base.off_rating * off_factor, 2),
+            "Net Rating": round(base.net_rating + base.off_rating * (off_factor - 1), 2),
+            "Elo": round(summary["Elo"] + elo_delta, 2),
         }
-        feature_vector = pd.DataFrame([features])[feature_cols.columns]
-        projected_points = float(reg_model.predict(feature_vector))
-        win_probability = float(clf_model.predict_proba(feature_vector)[0, 1])
-
-        rows.append(
-            {
-                "date": matchup["date"],
-                "team": matchup["team"],
-                "opponent": matchup["opponent"],
-                "home": bool(matchup["home"]),
-                "projected_points": round(projected_points, 1),
-                "win_probability": round(win_probability, 3),
-            }
-        )
-    return pd.DataFrame(rows)
+    )
+
+    off_col = FEATURE_COLUMNS.index("offensive_rating")
+    opp_off_col = FEATURE_COLUMNS.index("opp_off_rating")
+    elo_col = FEATURE_COLUMNS.index("elo_diff")
+    elo_shift = _elo_diff(elo_delta, 0.0)  # the rating change on the elo_diff feature's scale
+    features = base.features.copy()
+    features[base.is_team, off_col] *= off_factor
+    features[base.is_opponent, opp_off_col] *= off_factor
+    features[base.is_team, elo_col] += elo_shift
+    features[base.is_opponent, elo_col] -= elo_shift
+
+    # Both models are linear, so score them straight from their coefficients.
+    projected_points = features @ base.reg_coef + base.reg_intercept
+    win_probability = 1 / (1 + np.exp(-(features @ base.clf_coef + base.clf_intercept)))
+    projections = base.upcoming.assign(
+        home=base.upcoming["home"].astype(bool),
+        projected_points=projected_points.round(1),
+        win_probability=win_probability.round(3),
+    )
+    return WhatIfResult(summary, projections)
+
+
+def power_rankings() -> pd.DataFrame:
+    """Return the current Elo rating for every team, strongest first."""
+    ratings = load_team_ratings().current_ratings()
+    return ratings.rename_axis("team").reset_index()
+
+
+def team_rating_history(team: str) -> pd.DataFrame:
+    """Return the per-date Elo rating history for a single team."""
+    history = load_team_ratings().history
+    return history.loc[history["team"] == team, ["date", "elo"]]
 
 
 def team_trend(team: str) -> pd.DataFrame:
+    if database.sql_backend_enabled():
+        return database.team_trend(team)
     games = load_game_data()
     subset = games[games["team"] == team].sort_values("date")
     subset = subset[["date", "offensive_rating", "defensive_rating", "pace"]]
     return subset
+
+
+def clear_caches() -> None:
+    """Drop every cached table, rating and model, e.g. after refreshing the data."""
+    global _team_ratings
+    _team_ratings = None
+    cached_loaders = (
+        _load_players,
+        _load_games,
+        latest_season,
+        load_upcoming_games,
+        _train_models,
+        _team_profiles,
+        _build_matchup_matrix,
+        _what_if_baseline,
+    )
+    for cached in cached_loaders:
+        cached.cache_clear()
@@ -0,0 +1,212 @@
+"""Optional SQLite backend for the player and game log tables.
+
+Set ``ANALYTICS_BACKEND=sqlite`` to have the analytics helpers push their
+filters and aggregates down to ``data/analytics.sqlite`` instead of filtering
+fully loaded CSV frames in pandas.  The database is written alongside the CSV
+partitions by ``scripts/refresh_data.py --sqlite`` and
+``scripts/build_sample_data.py --sqlite``.
+"""
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from .metrics import ensure_player_metrics, ensure_team_metrics
+from .ratings import BASE_RATING, build_ratings
+from .storage import DATA_DIR, PARTITIONED_TABLES, SeasonFilter, read_table as read_csv_table, season_key
+
+BACKEND_ENV = "ANALYTICS_BACKEND"
+DATABASE_NAME = "analytics.sqlite"
+RATINGS_TABLE = "team_ratings"
+
+# ``season`` on its own lets the latest-season lookups use MAX() without a scan.
+INDEXES = {
+    "players": [("team", "season"), ("player", "season"), ("season",)],
+    "team_games": [("team", "season"), ("date",), ("season",)],
+}
+# Fills in derived metric columns on rows carried over from an older table layout.
+_METRICS = {"players": ensure_player_metrics, "team_games": ensure_team_metrics}
+
+
+def sql_backend_enabled() -> bool:
+    """Return ``True`` when the analytics helpers should query SQLite."""
+    return os.environ.get(BACKEND_ENV, "csv").strip().lower() == "sqlite"
+
+
+def database_path(data_dir: Path = DATA_DIR) -> Path:
+    return data_dir / DATABASE_NAME
+
+
+def _regexp(pattern: str, value: Optional[str]) -> bool:
+    # Mirrors ``Series.str.contains(pattern, case=False, na=False)``.
+    return value is not None and re.search(pattern, value, flags=re.IGNORECASE) is not None
+
+
+def connect(data_dir: Path = DATA_DIR) -> sqlite3.Connection:
+    path = database_path(data_dir)
+    if not path.exists():
+        raise FileNotFoundError(
+            f"{path} does not exist; rebuild the data with --sqlite or unset {BACKEND_ENV}"
+        )
+    conn = sqlite3.connect(path)
+    conn.create_function("REGEXP", 2, _regexp, deterministic=True)
+    return conn
+
+
+def _table_exists(conn: sqlite3.Connection, table: str) -> bool:
+    query = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?"
+    return conn.execute(query, (table,)).fetchone() is not None
+
+
+def write_table(frame: pd.DataFrame, table: str, data_dir: Path = DATA_DIR) -> None:
+    """Replace the seasons present in ``frame`` inside the database table."""
+    frame = frame.assign(season=frame["season"].astype(int))
+    data_dir.mkdir(parents=True, exist_ok=True)
+    with closing(sqlite3.connect(database_path(data_dir))) as conn, conn:
+        if _table_exists(conn, table):
+            seasons = sorted(frame["season"].unique().tolist())
+            placeholders = ", ".join("?" for _ in seasons)
+            stored = [name for _, name, *_ in conn.execute(f"PRAGMA table_info({table})")]
+            if set(stored) != set(frame.columns):
+                # The layout changed (e.g. metric columns added since the table was
+                # written): carry the other seasons over and recreate the table.
+                kept = pd.read_sql_query(
+                    f"SELECT * FROM {table} WHERE season NOT IN ({placeholders}) ORDER BY rowid", conn, params=seasons
+                )
+                frame = pd.concat([_METRICS.get(table, lambda rows: rows)(kept), frame], ignore_index=True)
+                conn.execute(f"DROP TABLE {table}")
+            else:
+                conn.execute(f"DELETE FROM {table} WHERE season IN ({placeholders})", seasons)
+        # Newest season first so rowid order matches the CSV partition read order.
+        frame = frame.sort_values("season", ascending=False, kind="stable")
+        frame.to_sql(table, conn, if_exists="append", index=False)
+        for columns in INDEXES.get(table, []):
+            name = f"idx_{table}_{'_'.join(columns)}"
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})")
+
+
+def write_ratings(data_dir: Path = DATA_DIR) -> None:
+    """Replay the stored game log and save every team's current Elo rating.
+
+    Lets the team summary look up one rating instead of loading every season's
+    games.  Call it once after the last :func:`write_table` of ``team_games``.
+    """
+    games = read_table("team_games", data_dir=data_dir)
+    games["date"] = pd.to_datetime(games["date"])
+    ratings = build_ratings(games).current_ratings().rename_axis("team").reset_index()
+    with closing(sqlite3.connect(database_path(data_dir))) as conn, conn:
+        ratings.to_sql(RATINGS_TABLE, conn, if_exists="replace", index=False)
+
+
+def build_database(data_dir: Path = DATA_DIR) -> Path:
+    """Rebuild the whole database from the CSV partitions."""
+    path = database_path(data_dir)
+    path.unlink(missing_ok=True)
+    for table in PARTITIONED_TABLES:
+        write_table(read_csv_table(table, data_dir=data_dir), table, data_dir)
+    write_ratings(data_dir)
+    return path
+
+
+_SQL_DTYPES = {"INTEGER": "int64", "REAL": "float64"}
+
+
+def _read_sql(
+    query: str, params: Iterable = (), data_dir: Path = DATA_DIR, table: Optional[str] = None
+) -> pd.DataFrame:
+    with closing(connect(data_dir)) as conn:
+        frame = pd.read_sql_query(query, conn, params=list(params))
+        if frame.empty and table is not None:
+            # An empty result comes back as all-object columns; restore the declared types.
+            declared = {name: kind for _, name, kind, *_ in conn.execute(f"PRAGMA table_info({table})")}
+            frame = frame.astype({name: _SQL_DTYPES.get(declared.get(name), "object") for name in frame.columns})
+    return frame
+
+
+def read_table(table: str, seasons: SeasonFilter = None, data_dir: Path = DATA_DIR) -> pd.DataFrame:
+    """SQL counterpart of :func:`src.storage.read_table`."""
+    wanted = season_key(seasons)
+    query = f"SELECT * FROM {table}"
+    params: Tuple[int, ...] = ()
+    if wanted is not None:
+        query += f" WHERE season IN ({', '.join('?' for _ in wanted)})"
+        params = wanted
+    return _read_sql(query + " ORDER BY season DESC, rowid", params, data_dir)
+
+
+def available_seasons(table: str, data_dir: Path = DATA_DIR) -> List[int]:
+    with closing(connect(data_dir)) as conn:
+        rows = conn.execute(f"SELECT DISTINCT season FROM {table} ORDER BY season").fetchall()
+    return [season for (season,) in rows]
+
+
+def team_season_rows(team: str, data_dir: Path = DATA_DIR) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """Return the team's latest-season player and game rows via the (team, season) indexes.
+
+    The averages themselves are taken in pandas by the caller: SQLite sums in
+    extended precision, which would round a handful of summary values
+    differently from the CSV path.
+    """
+    player_query = """
+        SELECT * FROM players
+        WHERE team = ? AND season = (SELECT MAX(season) FROM players)
+        ORDER BY rowid
+    """
+    game_query = """
+        SELECT * FROM team_games
+        WHERE team = ? AND season = (SELECT MAX(season) FROM team_games)
+        ORDER BY rowid
+    """
+    with closing(connect(data_dir)) as conn:
+        players = pd.read_sql_query(player_query, conn, params=[team])
+        games = pd.read_sql_query(game_query, conn, params=[team])
+    return ensure_player_metrics(players), ensure_team_metrics(games)
+
+
+def team_rating(team: str, data_dir: Path = DATA_DIR) -> Optional[float]:
+    """Return the stored current Elo rating for ``team``.
+
+    Teams without games get the league-average rating.  ``None`` means the
+    database predates the ratings table and the caller should replay the game log.
+    """
+    with closing(connect(data_dir)) as conn:
+        if not _table_exists(conn, RATINGS_TABLE):
+            return None
+        row = conn.execute(f"SELECT elo FROM {RATINGS_TABLE} WHERE team = ?", (team,)).fetchone()
+    return BASE_RATING if row is None else row[0]
+
+
+def search_players(query: str, data_dir: Path = DATA_DIR) -> pd.DataFrame:
+    """Return players whose name or team matches the non-empty ``query``."""
+    sql = "SELECT * FROM players WHERE REGEXP(?, player) OR REGEXP(?, team) ORDER BY season DESC, rowid"
+    return ensure_player_metrics(_read_sql(sql, (query, query), data_dir, table="players"))
+
+
+def team_trend(team: str, data_dir: Path = DATA_DIR) -> pd.DataFrame:
+    sql = """
+        SELECT date, offensive_rating, defensive_rating, pace
+        FROM team_games
+        WHERE team = ?
+        ORDER BY date, season DESC, rowid
+    """
+    trend = _read_sql(sql, (team,), data_dir)
+    trend["date"] = pd.to_datetime(trend["date"])
+    return trend
+
+
+def player_projection_inputs(
+    player_name: str, data_dir: Path = DATA_DIR
+) -> Tuple[Optional[pd.Series], float, float]:
+    """Return the player's latest row plus league mean usage and minutes."""
+    row_query = "SELECT * FROM players WHERE player = ? ORDER BY season DESC, rowid LIMIT 1"
+    league_query = "SELECT AVG(usage_rate), AVG(minutes) FROM players"
+    with closing(connect(data_dir)) as conn:
+        row = pd.read_sql_query(row_query, conn, params=[player_name])
+        mean_usage, mean_minutes = conn.execute(league_query).fetchone()
+    return (None if row.empty else ensure_player_metrics(row).iloc[0]), mean_usage, mean_minutes
@@ -0,0 +1,69 @@
+"""Derived player and team metrics computed once when the data is ingested.
+
+The refresh and sample-data scripts store these columns next to the raw stats.
+Loaders call :func:`ensure_player_metrics` / :func:`ensure_team_metrics`, which
+only fill in columns that are missing (e.g. for hand-made CSV exports).
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable, Dict
+
+import pandas as pd
+
+from .storage import DATA_DIR, read_table, write_partitions
+
+
+def calculate_true_shooting(fg_pct, three_pct, ft_pct):
+    """Blend the three shooting percentages; works on scalars and whole columns."""
+    return (fg_pct + three_pct + ft_pct) / 3
+
+
+def _per_36(column: str) -> Callable[[pd.DataFrame], pd.Series]:
+    def compute(players: pd.DataFrame) -> pd.Series:
+        minutes = players["minutes"].where(players["minutes"] > 0)
+        return (players[column] * 36 / minutes).round(1)
+
+    return compute
+
+
+PLAYER_METRICS: Dict[str, Callable[[pd.DataFrame], pd.Series]] = {
+    "true_shooting": lambda p: calculate_true_shooting(p["fg_pct"], p["three_pct"], p["ft_pct"]).round(3),
+    "points_per_36": _per_36("points"),
+    "rebounds_per_36": _per_36("rebounds"),
+    "assists_per_36": _per_36("assists"),
+    "steals_per_36": _per_36("steals"),
+    "blocks_per_36": _per_36("blocks"),
+    "win_shares_per_game": lambda p: (p["win_shares"] / p["games_played"].where(p["games_played"] > 0)).round(3),
+}
+
+TEAM_METRICS: Dict[str, Callable[[pd.DataFrame], pd.Series]] = {
+    "point_diff": lambda g: g["team_points"] - g["opponent_points"],
+    "win": lambda g: (g["team_points"] > g["opponent_points"]).astype(int),
+    "net_rating": lambda g: (g["offensive_rating"] - g["defensive_rating"]).round(1),
+    "points_per_100": lambda g: (g["team_points"] * 100 / g["pace"].where(g["pace"] > 0)).round(1),
+    "opp_points_per_100": lambda g: (g["opponent_points"] * 100 / g["pace"].where(g["pace"] > 0)).round(1),
+}
+
+
+def _ensure(frame: pd.DataFrame, catalog: Dict[str, Callable[[pd.DataFrame], pd.Series]]) -> pd.DataFrame:
+    missing = {name: compute for name, compute in catalog.items() if name not in frame.columns}
+    if not missing:
+        return frame
+    return frame.assign(**{name: compute(frame) for name, compute in missing.items()})
+
+
+def ensure_player_metrics(players: pd.DataFrame) -> pd.DataFrame:
+    """Return ``players`` with every column in :data:`PLAYER_METRICS` present."""
+    return _ensure(players, PLAYER_METRICS)
+
+
+def ensure_team_metrics(games: pd.DataFrame) -> pd.DataFrame:
+    """Return ``games`` with every column in :data:`TEAM_METRICS` present."""
+    return _ensure(games, TEAM_METRICS)
+
+
+def materialize_metrics(data_dir: Path = DATA_DIR) -> None:
+    """Add any missing metric columns to the stored player and game partitions."""
+    write_partitions(ensure_player_metrics(read_table("players", data_dir=data_dir)), "players", data_dir)
+    write_partitions(ensure_team_metrics(read_table("team_games", data_dir=data_dir)), "team_games", data_dir)
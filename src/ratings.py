@@ -0,0 +1,256 @@
+"""Elo power ratings computed over the team game log."""
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+BASE_RATING = 1500.0
+K_FACTOR = 20.0
+HOME_ADVANTAGE = 100.0
+# Fraction of a team's distance from the league mean kept across the offseason.
+SEASON_CARRYOVER = 0.75
+
+
+def expected_score(rating_diff):
+    """Win probability for a side rated ``rating_diff`` points above its opponent."""
+    return 1.0 / (1.0 + 10.0 ** (-rating_diff / 400.0))
+
+
+def collapse_mirrored_games(games: pd.DataFrame) -> pd.DataFrame:
+    """Return one row per game with explicit home/away columns.
+
+    Game logs usually list each game twice (once from each team's perspective).
+    Rows are matched on date plus the unordered team pair, preferring the home
+    team's row, and then re-oriented so the home side is always in ``home_team``.
+    """
+    team = games["team"].to_numpy()
+    opponent = games["opponent"].to_numpy()
+    codes, _ = pd.factorize(np.concatenate([team, opponent]))
+    team_code, opponent_code = codes[: len(team)], codes[len(team) :]
+    key = pd.DataFrame(
+        {
+            "date": games["date"].to_numpy(),
+            "low": np.minimum(team_code, opponent_code),
+            "high": np.maximum(team_code, opponent_code),
+        }
+    )
+    order = np.argsort(-games["home"].to_numpy(), kind="stable")
+    keep = order[~key.iloc[order].duplicated().to_numpy()]
+    keep = keep[np.argsort(key["date"].to_numpy()[keep], kind="stable")]
+
+    is_home = games["home"].to_numpy()[keep] == 1
+    team, opponent = team[keep], opponent[keep]
+    team_points = games["team_points"].to_numpy()[keep]
+    opponent_points = games["opponent_points"].to_numpy()[keep]
+    return pd.DataFrame(
+        {
+            "date": games["date"].to_numpy()[keep],
+            "season": games["season"].to_numpy()[keep],
+            "home_team": np.where(is_home, team, opponent),
+            "away_team": np.where(is_home, opponent, team),
+            "home_points": np.where(is_home, team_points, opponent_points),
+            "away_points": np.where(is_home, opponent_points, team_points),
+        }
+    )
+
+
+def _pair(team: str, opponent: str) -> Tuple[str, str]:
+    return (team, opponent) if team <= opponent else (opponent, team)
+
+
+class EloRatings:
+    """Incrementally updated Elo ratings for every team in the game log.
+
+    Games are applied one date at a time: every game on a date is scored from the
+    ratings at the start of that date and the rating changes are summed, so each
+    date is a single vectorised NumPy step.  Calling :meth:`update` with newer
+    games continues from the stored state instead of replaying history.
+    """
+
+    def __init__(
+        self,
+        k_factor: float = K_FACTOR,
+        home_advantage: float = HOME_ADVANTAGE,
+        season_carryover: float = SEASON_CARRYOVER,
+        use_margin: bool = True,
+    ) -> None:
+        self.k_factor = k_factor
+        self.home_advantage = home_advantage
+        self.season_carryover = season_carryover
+        self.use_margin = use_margin
+
+        self._team_index: Dict[str, int] = {}
+        self._ratings = np.empty(0)
+        self.last_date: Optional[pd.Timestamp] = None
+        self.last_season: Optional[int] = None
+        # Team pairs already applied on ``last_date``, so a refresh run partway
+        # through a day can pick up that day's remaining games later.
+        self._last_date_pairs: Set[Tuple[str, str]] = set()
+        # Bumped by every update that applies games; lets callers key caches on the rating state.
+        self.version = 0
+
+        self._history_chunks: List[pd.DataFrame] = []
+        self._pregame_chunks: List[pd.DataFrame] = []
+        self._history: Optional[pd.DataFrame] = None
+        self._pregame: Optional[pd.DataFrame] = None
+
+    def _team_codes(self, teams: np.ndarray) -> np.ndarray:
+        for team in pd.unique(teams):
+            if team not in self._team_index:
+                self._team_index[team] = len(self._team_index)
+        missing = len(self._team_index) - len(self._ratings)
+        if missing:
+            self._ratings = np.concatenate([self._ratings, np.full(missing, BASE_RATING)])
+        return pd.Index(list(self._team_index)).get_indexer(teams)
+
+    def update(self, games: pd.DataFrame) -> int:
+        """Apply games that have not been rated yet and return how many were used.
+
+        ``games`` uses the ``team_games.csv`` layout; mirrored rows are collapsed
+        automatically.  Games dated before :attr:`last_date` are assumed to be
+        folded in already and are skipped.  Games on :attr:`last_date` are matched
+        on their team pair, so only the ones not seen by an earlier call are applied.
+        """
+        if self.last_date is not None:
+            games = games[games["date"] >= self.last_date]
+        if games.empty:
+            return 0
+
+        schedule = collapse_mirrored_games(games)
+        if self.last_date is not None:
+            seen = np.array(
+                [
+                    date == self.last_date and _pair(home, away) in self._last_date_pairs
+                    for date, home, away in zip(schedule["date"], schedule["home_team"], schedule["away_team"])
+                ],
+                dtype=bool,
+            )
+            schedule = schedule[~seen].reset_index(drop=True)
+            if schedule.empty:
+                return 0
+
+        home = self._team_codes(schedule["home_team"].to_numpy())
+        away = self._team_codes(schedule["away_team"].to_numpy())
+        margin = (schedule["home_points"] - schedule["away_points"]).to_numpy(dtype=float)
+        result = (margin > 0) + 0.5 * (margin == 0)
+        seasons = schedule["season"].to_numpy()
+        dates = schedule["date"].to_numpy()
+
+        _, starts = np.unique(dates, return_index=True)
+        bounds = np.append(starts, len(dates))
+
+        ratings = self._ratings
+        pre_home = np.empty(len(dates))
+        pre_away = np.empty(len(dates))
+        post_home = np.empty(len(dates))
+        post_away = np.empty(len(dates))
+
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            season = seasons[start]
+            if self.last_season is not None and season != self.last_season:
+                ratings += (1 - self.season_carryover) * (BASE_RATING - ratings)
+            self.last_season = season
+
+            h = home[start:end]
+            a = away[start:end]
+            pre_home[start:end] = ratings[h]
+            pre_away[start:end] = ratings[a]
+
+            diff = ratings[h] + self.home_advantage - ratings[a]
+            expected = expected_score(diff)
+            delta = self.k_factor * (result[start:end] - expected)
+            if self.use_margin:
+                # Dampen blowouts by favourites so rating gaps do not run away.
+                winner_diff = np.where(margin[start:end] >= 0, diff, -diff)
+                delta *= np.log1p(np.abs(margin[start:end])) * 2.2 / (winner_diff * 0.001 + 2.2)
+            np.add.at(ratings, h, delta)
+            np.add.at(ratings, a, -delta)
+
+            post_home[start:end] = ratings[h]
+            post_away[start:end] = ratings[a]
+
+        last_date = pd.Timestamp(dates[-1])
+        if last_date != self.last_date:
+            self._last_date_pairs = set()
+        on_last = dates == dates[-1]
+        self._last_date_pairs.update(
+            _pair(home, away)
+            for home, away in zip(schedule["home_team"].to_numpy()[on_last], schedule["away_team"].to_numpy()[on_last])
+        )
+        self.last_date = last_date
+        self.version += 1
+        self._record(schedule, pre_home, pre_away, post_home, post_away)
+        return len(schedule)
+
+    def _record(
+        self,
+        schedule: pd.DataFrame,
+        pre_home: np.ndarray,
+        pre_away: np.ndarray,
+        post_home: np.ndarray,
+        post_away: np.ndarray,
+    ) -> None:
+        dates = np.tile(schedule["date"].to_numpy(), 2)
+        seasons = np.tile(schedule["season"].to_numpy(), 2)
+        teams = np.concatenate([schedule["home_team"].to_numpy(), schedule["away_team"].to_numpy()])
+        opponents = np.concatenate([schedule["away_team"].to_numpy(), schedule["home_team"].to_numpy()])
+
+        pregame = pd.DataFrame(
+            {
+                "date": dates,
+                "team": teams,
+                "opponent": opponents,
+                "elo": np.concatenate([pre_home, pre_away]),
+                "opp_elo": np.concatenate([pre_away, pre_home]),
+            }
+        )
+        history = pd.DataFrame(
+            {"date": dates, "season": seasons, "team": teams, "elo": np.concatenate([post_home, post_away])}
+        )
+        # A team playing twice on a date keeps only its end-of-day rating.
+        history = history.sort_values("date", kind="stable").drop_duplicates(["date", "team"], keep="last")
+
+        self._pregame_chunks.append(pregame)
+        self._history_chunks.append(history)
+        self._pregame = None
+        self._history = None
+
+    @property
+    def history(self) -> pd.DataFrame:
+        """End-of-day rating for every team on every date it played."""
+        if self._history is None:
+            columns = ["date", "season", "team", "elo"]
+            chunks = self._history_chunks or [pd.DataFrame(columns=columns)]
+            history = pd.concat(chunks, ignore_index=True)
+            # A date split across two updates keeps the rating from the later one.
+            history = history.drop_duplicates(["date", "team"], keep="last")
+            self._history = history.sort_values(["date", "team"], ignore_index=True)
+        return self._history
+
+    @property
+    def pregame(self) -> pd.DataFrame:
+        """Ratings of both teams going into each game, one row per team perspective."""
+        if self._pregame is None:
+            columns = ["date", "team", "opponent", "elo", "opp_elo"]
+            chunks = self._pregame_chunks or [pd.DataFrame(columns=columns)]
+            self._pregame = pd.concat(chunks, ignore_index=True)
+        return self._pregame
+
+    def rating(self, team: str) -> float:
+        """Return the current rating for ``team`` (league average for unseen teams)."""
+        index = self._team_index.get(team)
+        return BASE_RATING if index is None else float(self._ratings[index])
+
+    def current_ratings(self) -> pd.Series:
+        """Return the current rating of every team, strongest first."""
+        teams = list(self._team_index)
+        return pd.Series(self._ratings[: len(teams)], index=teams, name="elo").sort_values(ascending=False)
+
+
+def build_ratings(games: pd.DataFrame, **kwargs) -> EloRatings:
+    """Replay ``games`` from scratch and return the fitted :class:`EloRatings`."""
+    ratings = EloRatings(**kwargs)
+    ratings.update(games)
+    return ratings
@@ -0,0 +1,105 @@
+"""Season-partitioned CSV storage for the player and game log tables.
+
+Each partitioned table lives in its own folder with one file per season, e.g.
+``data/players/season=2025.csv``.  Readers only open the partitions they need,
+and writers can replace a single season without touching the others.  A plain
+``data/<table>.csv`` file is still read when no partition folder exists so
+hand-made exports keep working.
+"""
+from __future__ import annotations
+
+import numbers
+import os
+import re
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+# ``ANALYTICS_DATA_DIR`` points the dashboard and scripts at another data folder.
+DATA_DIR = Path(os.environ.get("ANALYTICS_DATA_DIR", Path(__file__).resolve().parents[1] / "data"))
+PARTITIONED_TABLES = ("players", "team_games")
+
+_PARTITION_PATTERN = re.compile(r"season=(\d+)\.csv$")
+
+SeasonFilter = Optional[Union[int, Iterable[int]]]
+
+
+def season_key(seasons: SeasonFilter) -> Optional[Tuple[int, ...]]:
+    """Normalise a season filter into a hashable, sorted tuple (``None`` means all seasons)."""
+    if seasons is None:
+        return None
+    if isinstance(seasons, (numbers.Integral, str)):
+        seasons = [seasons]
+    return tuple(sorted({int(season) for season in seasons}))
+
+
+def partition_dir(table: str, data_dir: Path = DATA_DIR) -> Path:
+    return data_dir / table
+
+
+def partition_path(table: str, season: int, data_dir: Path = DATA_DIR) -> Path:
+    return partition_dir(table, data_dir) / f"season={int(season)}.csv"
+
+
+def legacy_path(table: str, data_dir: Path = DATA_DIR) -> Path:
+    return data_dir / f"{table}.csv"
+
+
+def _partition_files(table: str, data_dir: Path) -> List[Tuple[int, Path]]:
+    folder = partition_dir(table, data_dir)
+    if not folder.is_dir():
+        return []
+    files = []
+    for path in folder.iterdir():
+        match = _PARTITION_PATTERN.search(path.name)
+        if match:
+            files.append((int(match.group(1)), path))
+    return sorted(files)
+
+
+def available_seasons(table: str, data_dir: Path = DATA_DIR) -> List[int]:
+    """Return the seasons stored for ``table`` without loading the data itself."""
+    files = _partition_files(table, data_dir)
+    if files:
+        return [season for season, _ in files]
+    legacy = legacy_path(table, data_dir)
+    if not legacy.exists():
+        return []
+    return sorted(pd.read_csv(legacy, usecols=["season"])["season"].unique().tolist())
+
+
+def read_table(table: str, seasons: SeasonFilter = None, data_dir: Path = DATA_DIR) -> pd.DataFrame:
+    """Read ``table`` restricted to ``seasons``, opening only the matching partitions."""
+    wanted = season_key(seasons)
+    files = _partition_files(table, data_dir)
+    if not files:
+        frame = pd.read_csv(legacy_path(table, data_dir))
+        if wanted is not None:
+            frame = frame[frame["season"].isin(wanted)].reset_index(drop=True)
+        return frame
+
+    # Newest season first, matching the row order the refresh scripts have always written.
+    selected = [path for season, path in reversed(files) if wanted is None or season in wanted]
+    if not selected:
+        # Keep the column layout so downstream filters still work on an empty frame.
+        return pd.read_csv(files[0][1], nrows=0)
+    return pd.concat([pd.read_csv(path) for path in selected], ignore_index=True)
+
+
+def clear_partitions(table: str, data_dir: Path = DATA_DIR) -> None:
+    """Delete every stored season of ``table`` (used before a full rebuild)."""
+    for _, path in _partition_files(table, data_dir):
+        path.unlink()
+
+
+def write_partitions(frame: pd.DataFrame, table: str, data_dir: Path = DATA_DIR) -> List[Path]:
+    """Write one CSV per season in ``frame``, replacing only those seasons' partitions."""
+    folder = partition_dir(table, data_dir)
+    folder.mkdir(parents=True, exist_ok=True)
+    written = []
+    for season, part in frame.groupby(frame["season"].astype(int), sort=True):
+        path = partition_path(table, season, data_dir)
+        part.to_csv(path, index=False)
+        written.append(path)
+    return written